@@ -114,9 +114,17 @@ def init_network(decay_coefficient: float, exploration_rate: float, strengthenin
         's7': {'a7': sensory_to_afferent},
     }
 
-    afferent_regions_connections = {name: {region_name: fn if region_name != name else afferent_to_self for region_names, fn in afferent_graph_generation_fns for region_name in region_names} for name in afferent_region_names}
-    efferent_regions_connections = {name: {region_name: fn if region_name != name else efferent_to_self for region_names, fn in efferent_graph_generation_fns for region_name in region_names} for name in efferent_region_names}
-    internal_regions_connections = {name: {region_name: fn if region_name != name else internal_to_self for region_names, fn in internal_graph_generation_fns for region_name in region_names} for name in internal_region_names}
+    # Builds the cross-region connections first, then overwrites the self-connection in a second pass.
+    # This avoids comparing each region's name against the source's name in the inner loop.
+    afferent_regions_connections = {name: {region_name: fn for region_names, fn in afferent_graph_generation_fns for region_name in region_names} for name in afferent_region_names}
+    for name in afferent_region_names:
+        afferent_regions_connections[name][name] = afferent_to_self
+    efferent_regions_connections = {name: {region_name: fn for region_names, fn in efferent_graph_generation_fns for region_name in region_names} for name in efferent_region_names}
+    for name in efferent_region_names:
+        efferent_regions_connections[name][name] = efferent_to_self
+    internal_regions_connections = {name: {region_name: fn for region_names, fn in internal_graph_generation_fns for region_name in region_names} for name in internal_region_names}
+    for name in internal_region_names:
+        internal_regions_connections[name][name] = internal_to_self
     
     regions_connectome = {**sensory_regions_connections, **afferent_regions_connections, **efferent_regions_connections, **internal_regions_connections}
 
@@ -39,6 +39,7 @@ class Network():
     _sensory_regions_names_ : list[str]
     _internal_regions_indexes_ : list[int]
     _region_dict_: dict[str, Region]
+    _motor_indexes_cache_: dict[tuple[str, ...], list[NDArray[np.intp]]]
     _state: NDArray[np.float16]
     _state_history_: deque[NDArray[np.float16]]
     _free_energy_history_: list[float]
@@ -109,6 +110,7 @@ class Network():
         self._sensory_regions_names_ = sensory_regions_names
         self._internal_regions_indexes_ = internal_regions_indexes
         self._region_dict_ = {region.name: region for region in self.regions}
+        self._motor_indexes_cache_ = {}
         self._state = np.concatenate([region.get_state() for region in self.regions])
         self._state_history_ = deque([self._state] * self.state_history_size, maxlen=self.state_history_size)
         self._free_energy_history_ = []
@@ -124,6 +126,13 @@ class Network():
             conformation_builder.append(np.concatenate(source_region_conformation, axis=0))
         self._conformation = np.concatenate(conformation_builder, axis=1)
 
+    def process_tick(self, generator: Generator, sensory_signal: dict[str, list[float]] | None = None) -> float:
+        """Runs a full network update for one simulation tick: propagates the signal, optimizes the connections and
+        computes the free energy. Returns the computed free energy."""
+        self.propagate_signal(generator, sensory_signal)
+        self.optimize_connections()
+        return self.compute_free_energy()
+
     def compute_free_energy(self) -> float:
         """Computes the network's free energy, stores it in its history and returns the computed value."""
         internal_state = self.get_internal_state()
@@ -302,13 +311,16 @@ class Network():
     
     def get_motor_signal(self, accessed_regions: tuple[str]) -> list[float]:
         """Returns the average potential of action triggered during the last `self.state_history` iterations in an accessed region, normalized by its number of neurons."""
-        accessed_indexes = []
-        for region_name in accessed_regions:
-            try:
-                accessed_indexes.append(self._region_dict_[region_name].get_neurons_index())
-            except KeyError:
-                raise NetworkCommunicationError(f"unknown region '{region_name}'")
-        
+        accessed_indexes = self._motor_indexes_cache_.get(accessed_regions)
+        if accessed_indexes is None:
+            accessed_indexes = []
+            for region_name in accessed_regions:
+                try:
+                    accessed_indexes.append(np.asarray(self._region_dict_[region_name].get_neurons_index(), dtype=np.intp))
+                except KeyError:
+                    raise NetworkCommunicationError(f"unknown region '{region_name}'")
+            self._motor_indexes_cache_[accessed_regions] = accessed_indexes
+
         motor_signal = np.zeros(len(accessed_regions))
         for state in self._state_history_:
             for signal_index, list_indexes in enumerate(accessed_indexes):
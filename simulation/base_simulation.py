@@ -7,12 +7,16 @@ The class defined here should not directly be used as Simulation object.
 import json
 import os
 
+import numpy as np
+
 from datetime import datetime
+from typing import BinaryIO, Callable
 from numpy.random import Generator, PCG64
 from numpy.typing import NDArray
 
 from simulation.exceptions import LoadingError
 from simulation.elements.base_element import Element
+from simulation.geometry.shape import Shape
 
 # Imports needed for eval when loading files
 from numpy import array                                     # noqa: F401
@@ -22,6 +26,10 @@ from simulation.geometry.vector import Vector2D             # noqa: F401
 from simulation.geometry.triangle import IsoscelesTriangle  # noqa: F401
 
 RESULT_PATH_DIR = os.path.join("results")
+ENV_HISTORY_INITIAL_CAPACITY = 1024
+
+# Sentinel used to detect missing attributes when comparing simulations.
+_MISSING_ATTRIBUTE = object()
 
 class Simulation():
     """Base class for all Simulation objects."""
@@ -32,9 +40,17 @@ class Simulation():
     generator_seed: int | None
     _elements: list[Element]
     _simulation_dir_: str
+    _config_file_path_: str
     _generator_: Generator
-    _env_history_: list[tuple[str | int | Element | Vector2D]]
+    _env_shapes_: tuple[Shape, ...]
+    _env_history_: NDArray[np.float32]
+    _env_history_offset_: int
+    _env_history_stream_: BinaryIO | None
+    _env_history_streamed_: bool
+    _env_history_callback_: Callable[[NDArray[np.float32]], None] | None
     _timer_: int
+    _comparable_keys_: tuple[str, ...]
+    _represented_keys_: tuple[str, ...]
     
     def __init__(self, height: int, width: int, frequency: int, elements: list[Element], simulation_name: str | None = None, generator_seed: int | None = None):
         """Base class for all Simulation objects.
@@ -58,26 +74,43 @@ class Simulation():
         self.generator_seed = generator_seed
 
         self._simulation_dir_ = os.path.join(RESULT_PATH_DIR, self.simulation_name)
+        self._config_file_path_ = os.path.join(self._simulation_dir_, "config.json")
         os.makedirs(self._simulation_dir_, exist_ok=True)
 
         self._generator_ = Generator(PCG64(generator_seed))
         
-        self._env_history_ = [tuple(element.shape for element in self._elements)]
-        self._env_history_.append(tuple(element.shape.center for element in self._elements))
+        self._env_shapes_ = tuple(element.shape for element in self._elements)
+        self._env_history_ = np.empty((ENV_HISTORY_INITIAL_CAPACITY, len(self._elements), 2), dtype=np.float32)
+        for element_index, element in enumerate(self._elements):
+            self._env_history_[0, element_index, 0] = element.shape.center.x
+            self._env_history_[0, element_index, 1] = element.shape.center.y
+        self._env_history_offset_ = 0
+        self._env_history_stream_ = None
+        self._env_history_streamed_ = False
+        self._env_history_callback_ = None
         self._timer_ = 0
 
     def __eq__(self, other) -> bool:
         """Checks if two Simulation objects are equal."""
-        if isinstance(other, self.__class__):
-            self_filtered_dict = {key : value for key, value in self.__dict__.items() if not key.endswith('_')}
-            other_filtered_dict = {key : value for key, value in other.__dict__.items() if not key.endswith('_')}
-            return self_filtered_dict == other_filtered_dict
+        # Exact type match: a subclass carries extra attributes the base class would not compare.
+        if type(other) is type(self):
+            try:
+                comparable_keys = self._comparable_keys_
+            except AttributeError:
+                comparable_keys = self._comparable_keys_ = tuple(key for key in self.__dict__ if not key.endswith('_'))
+            self_dict = self.__dict__
+            other_dict = other.__dict__
+            return all(self_dict[key] == other_dict.get(key, _MISSING_ATTRIBUTE) for key in comparable_keys)
         else:
             return False
 
     def __repr__(self) -> str:
         """Simulation object's representation."""
-        filtered_attributes = {key: value for key, value in self.__dict__.items() if not key.startswith('_')}
+        try:
+            represented_keys = self._represented_keys_
+        except AttributeError:
+            represented_keys = self._represented_keys_ = tuple(key for key in self.__dict__ if not key.startswith('_'))
+        filtered_attributes = {key: self.__dict__[key] for key in represented_keys}
 
         # The base simulation must also include its _elements attribute in its representation, but its children must not.
         if issubclass(Simulation, self.__class__):
@@ -93,43 +126,109 @@ class Simulation():
         """Updates the states of the simulation's elements based on its previous states, then resolves elements interaction."""
         for element in self._elements:
             element.update()
-        self._env_history_.append(tuple(element.shape.center for element in self._elements))
         self._timer_ += 1
+        if self._env_history_callback_ is not None:
+            frame = self._env_history_[0]
+            self._env_history_offset_ = self._timer_
+        else:
+            frame_index = self._timer_ - self._env_history_offset_
+            if frame_index >= self._env_history_.shape[0]:
+                if self._env_history_stream_ is not None:
+                    self._flush_env_history(self._env_history_.shape[0])
+                    frame_index = 0
+                else:
+                    self._grow_env_history()
+            frame = self._env_history_[frame_index]
+        for element_index, element in enumerate(self._elements):
+            center = element.shape.center
+            frame[element_index, 0] = center.x
+            frame[element_index, 1] = center.y
+        if self._env_history_callback_ is not None:
+            self._env_history_callback_(frame)
+
+    def _grow_env_history(self) -> None:
+        """Doubles the capacity of the environnement history buffer."""
+        grown_env_history = np.empty((2*self._env_history_.shape[0], len(self._elements), 2), dtype=np.float32)
+        grown_env_history[:self._env_history_.shape[0]] = self._env_history_
+        self._env_history_ = grown_env_history
+
+    def _flush_env_history(self, filled_frames: int) -> None:
+        """Appends the filled part of the history buffer to the streaming file and frees the buffer for reuse."""
+        np.save(self._env_history_stream_, self._env_history_[:filled_frames])
+        self._env_history_offset_ += filled_frames
+
+    def enable_env_history_streaming(self, env_history_file_name: str = "env_history.npy") -> None:
+        """Streams the environnement history to disk incrementally: whenever the in-memory buffer fills up, it is appended
+        to the given file instead of being reallocated, keeping memory usage constant for arbitrarily long runs.
+        The stream is finalized by save_env_history."""
+        env_history_file_path = os.path.join(self._simulation_dir_, env_history_file_name)
+        self._env_history_stream_ = open(env_history_file_path, "wb")
+        self._env_history_streamed_ = True
+
+    def register_env_history_callback(self, env_history_callback: Callable[[NDArray[np.float32]], None]) -> None:
+        """Hands each recorded frame to the given callback instead of accumulating the environnement history in memory,
+        keeping memory usage constant for arbitrarily long runs. The frames already recorded — at least the initial state
+        from construction — are delivered immediately, so the callback observes every frame of the run. The callback
+        receives an (elements, 2) float32 view that is overwritten on the next step and must be copied by consumers that
+        want to retain it."""
+        self._env_history_callback_ = env_history_callback
+        for frame in self.get_env_history():
+            env_history_callback(frame)
 
     def save_config(self) -> None:
         """Saves the simulation's configuration as a json file."""
-        config_file_path = os.path.join(self._simulation_dir_, "config.json")
-        with open(config_file_path, "w") as config_file:
+        with open(self._config_file_path_, "w") as config_file:
             json.dump(repr(self), config_file)
     
-    def save_env_history(self, env_history_file_name: str = "env_history.json") -> None:
-        """Saves the simulation's environnement history as a json file."""
-        env_history_file_path = os.path.join(self._simulation_dir_, env_history_file_name)
-        with open(env_history_file_path, "w") as env_history_file:
-            json.dump(repr(self._env_history_), env_history_file)
+    def save_env_history(self, env_history_file_name: str = "env_history.npy") -> None:
+        """Saves the simulation's environnement history as a binary numpy file. When streaming is enabled, this flushes the
+        remaining buffered frames to the streaming file (ignoring the given file name) and closes the stream."""
+        if self._env_history_stream_ is not None:
+            # Final flush, without advancing the offset: the buffered tail stays addressable through
+            # get_env_history once the stream is closed.
+            np.save(self._env_history_stream_, self._env_history_[:self._timer_ - self._env_history_offset_ + 1])
+            self._env_history_stream_.close()
+            self._env_history_stream_ = None
+        elif self._env_history_streamed_:
+            # The whole run already lives in the streamed file; saving again must not overwrite it
+            # with only the frames still buffered in memory.
+            return
+        else:
+            env_history_file_path = os.path.join(self._simulation_dir_, env_history_file_name)
+            np.save(env_history_file_path, self.get_env_history())
+
+    def get_env_history(self) -> NDArray[np.float32]:
+        """Returns a view of the elements' center coordinates recorded at each iteration, as an array of shape (iterations + 1, elements, 2).
+        When streaming is enabled, only the frames still buffered in memory are returned."""
+        return self._env_history_[:self._timer_ - self._env_history_offset_ + 1]
+
+    def get_env_shapes(self) -> tuple[Shape, ...]:
+        """Returns the shape of each element tracked in the environnement history."""
+        return self._env_shapes_
 
-    def get_env_history(self) -> list[tuple[str | int | Element | Vector2D]]:
-        return self._env_history_.copy()
-    
     def get_simulation_dir(self) -> str:
         return self._simulation_dir_
     
     def get_time(self) -> int:
         return self._timer_
 
+# Classes allowed when rebuilding objects from their saved representation. Restricting the evaluation
+# to this registry keeps a tampered config file from executing arbitrary code through the loader.
+LOADING_CLASS_REGISTRY = {class_.__name__: class_ for class_ in (Simulation, Element, Circle, Rectangle, Vector2D, IsoscelesTriangle)}
+LOADING_CLASS_REGISTRY["array"] = array
+
 def load_simulation(simulation_name: str) -> Simulation:
     """Loads a simulation from the result directory by its name."""
     simulation_dir = os.path.join(RESULT_PATH_DIR, simulation_name)
-    if not os.path.exists(simulation_dir):
-        raise FileNotFoundError(f"simulation's directory ({simulation_dir}) was not found in the result repository.")
-    
     config_file_path = os.path.join(simulation_dir, "config.json")
-    if not os.path.exists(config_file_path):
+    if not os.path.isfile(config_file_path):
+        if not os.path.isdir(simulation_dir):
+            raise FileNotFoundError(f"simulation's directory ({simulation_dir}) was not found in the result repository.")
         raise FileNotFoundError(f"simulation's directory ({simulation_dir}) does not contain a config file.")
-    
+
     with open(config_file_path, "r") as config_file:
         loaded_simulation_data = json.load(config_file)
-    loaded_simulation = eval(loaded_simulation_data)
+    loaded_simulation = eval(loaded_simulation_data, {"__builtins__": {}}, LOADING_CLASS_REGISTRY)
 
     # Checks the format of the resulting object.
     if not isinstance(loaded_simulation, Simulation):
@@ -138,20 +237,22 @@ def load_simulation(simulation_name: str) -> Simulation:
         raise LoadingError(f"saved simulation's name ({loaded_simulation.simulation_name}) does not match its repository name ({simulation_name})")
     return loaded_simulation
         
-def load_env_history(env_history_file_path: str) -> list[tuple[str|int|Element|Vector2D]]:
-    """Loads a env_history file into a tuple."""
-    with open(env_history_file_path, "r") as env_history_file:
-        loaded_env_history_data = json.load(env_history_file)
+def load_env_history(env_history_file_path: str) -> NDArray[np.float32]:
+    """Loads a env_history file into an array of shape (iterations + 1, elements, 2). Streamed files holding several
+    chunks are concatenated back into a single array."""
+    loaded_chunks = []
+    file_size = os.path.getsize(env_history_file_path)
+    with open(env_history_file_path, "rb") as env_history_file:
+        while env_history_file.tell() < file_size:
+            loaded_chunks.append(np.load(env_history_file))
 
-    loaded_env_history = eval(loaded_env_history_data)
+    if len(loaded_chunks) == 1:
+        return loaded_chunks[0]
+    return np.concatenate(loaded_chunks, axis=0)
 
-    return loaded_env_history
-
-def load_success_history(success_history_file_path: str) -> list[NDArray]:
-    """Loads a success_history file into a list of arrays"""
+def load_success_history(success_history_file_path: str) -> NDArray:
+    """Loads a success_history file into an array of shape (rallies, 2)."""
     with open(success_history_file_path, "r") as success_history_file:
         loaded_success_history_data = json.load(success_history_file)
 
-    loaded_success_history = eval(loaded_success_history_data)
-
-    return loaded_success_history
\ No newline at end of file
+    return np.asarray(loaded_success_history_data)
\ No newline at end of file
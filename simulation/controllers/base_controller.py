@@ -6,33 +6,62 @@ The Controller class defined here should not directly be used as a controller of
 
 from __future__ import annotations
 
-from simulation.elements.base_element import Element
+from typing import Any, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from simulation.elements.base_element import Element
+
+# Per-class caches for the attribute names used by __eq__ and __repr__. Subclasses that do not declare
+# slots can carry instance-specific attributes and are left out of the caches.
+_COMPARABLE_NAMES_CACHE: dict[type, tuple[str, ...]] = {}
+_REPRESENTED_NAMES_CACHE: dict[type, tuple[str, ...]] = {}
 
 class Controller:
     """Base class for all Controller objects."""
+    __slots__ = ()
 
     def __init__(self):
         """Base class for all Controller objects."""
 
+    def _attribute_items(self) -> list[tuple[str, Any]]:
+        """Returns the controller's (name, value) attribute pairs, walking __slots__ across the class hierarchy and
+        falling back on __dict__ for subclasses that do not declare slots."""
+        attribute_items = []
+        for class_ in reversed(type(self).__mro__):
+            for name in class_.__dict__.get('__slots__', ()):
+                attribute_items.append((name, getattr(self, name)))
+        instance_dict = getattr(self, '__dict__', None)
+        if instance_dict is not None:
+            attribute_items.extend(instance_dict.items())
+        return attribute_items
+
     def __eq__(self, other) -> bool:
         """Checks if two Controller objects are equal."""
-        if isinstance(other, self.__class__):
-            self_filtered_dict = {key : value for key, value in self.__dict__.items() if not key.endswith('_')}
-            other_filtered_dict = {key : value for key, value in other.__dict__.items() if not key.endswith('_')}
-            return self_filtered_dict == other_filtered_dict
-        else:
+        # Exact type match: a subclass carries extra attributes the base class would not compare.
+        if type(other) is not type(self):
             return False
-        
+        comparable_names = _COMPARABLE_NAMES_CACHE.get(type(self))
+        if comparable_names is None:
+            comparable_names = tuple(name for name, _ in self._attribute_items() if not name.endswith('_'))
+            if not hasattr(self, '__dict__'):
+                _COMPARABLE_NAMES_CACHE[type(self)] = comparable_names
+        try:
+            return all(getattr(self, name) == getattr(other, name) for name in comparable_names)
+        except AttributeError:
+            return False
+
     def __repr__(self) -> str:
         """Controller object's representation."""
-        filtered_attributes = {key: value for key, value in self.__dict__.items() if not key.startswith('_')}
-        return f"{self.__class__.__name__}({', '.join(f'{key}={repr(value)}' for key, value in filtered_attributes.items())})"
-    
+        represented_names = _REPRESENTED_NAMES_CACHE.get(type(self))
+        if represented_names is None:
+            represented_names = tuple(name for name, _ in self._attribute_items() if not name.startswith('_'))
+            if not hasattr(self, '__dict__'):
+                _REPRESENTED_NAMES_CACHE[type(self)] = represented_names
+        return f"{self.__class__.__name__}({', '.join(f'{name}={repr(getattr(self, name))}' for name in represented_names)})"
+
     def __str__(self) -> str:
-        """Controller object's string representation for testing purposes."""        
-        return f"{self.__class__.__name__}({self.__dict__})"
+        """Controller object's string representation for testing purposes."""
+        return f"{self.__class__.__name__}({dict(self._attribute_items())})"
         
     def update(self, controlled_element: Element) -> None:
         """Updates controlled element's state."""
-        if not isinstance(controlled_element, Element):
-            raise TypeError(f"unsupported parameter type(s) for reference: '{type(controlled_element).__name__}'")
@@ -2,15 +2,23 @@
 NetworkController class module. Inherits from the Controller class. Used to transform the motor signal from the network into an action on the controlled element.
 """
 
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
 from network.exceptions import NetworkCommunicationError as CommunicationError
 from network.network import Network
 from simulation.controllers.base_controller import Controller
 from simulation.controllers.exceptions import ControllerInitializationError as InitializationError
-from simulation.elements.base_element import Element
-from simulation.geometry.vector import Vector2D
+from simulation.geometry.vector import Vector2D, ZERO_VECTOR
+
+if TYPE_CHECKING:
+    from simulation.elements.base_element import Element
 
 class NetworkController(Controller):
     """Base class for NetworkController objects."""
+    __slots__ = ('network', 'accessed_regions')
+
     network: Network
     accessed_regions: tuple[str]
 
@@ -33,8 +41,11 @@ class NetworkController(Controller):
 
 class ConstantSpeedNetworkController(NetworkController):
     """Moves the element vertically by a fixed speed based on the average firing in the motor regions."""
+    __slots__ = ('reference_speed', 'signal_threshold', '_backward_speed_')
+
     reference_speed: Vector2D
     signal_threshold: float
+    _backward_speed_: Vector2D
 
     def __init__(self, network: Network, accessed_regions: tuple[str], reference_speed: Vector2D, signal_threshold: float):
         """NetworkController that moves the element vertically by a fixed speed based on the average firing in the motor region.
@@ -52,17 +63,21 @@ class ConstantSpeedNetworkController(NetworkController):
         
         self.reference_speed = reference_speed
         self.signal_threshold = float(signal_threshold)
+        self._backward_speed_ = -reference_speed
 
     def update(self, controlled_element: Element) -> None:
-        super().update(controlled_element)
-
         # Gets the signal for moving foward or moving backward
         forward_signal, backward_signal = self.network.get_motor_signal(self.accessed_regions)
 
-        # Moves the element based on the given threshold
-        controlled_element_speed = Vector2D(0.0, 0.0)
-        if forward_signal >= self.signal_threshold:
-            controlled_element_speed += self.reference_speed
-        if backward_signal >= self.signal_threshold:
-            controlled_element_speed -= self.reference_speed
+        # Moves the element based on the given threshold. When both signals fire, the motions cancel out and
+        # the element stands still.
+        signal_threshold = self.signal_threshold
+        move_forward = forward_signal >= signal_threshold
+        move_backward = backward_signal >= signal_threshold
+        if move_forward == move_backward:
+            controlled_element_speed = ZERO_VECTOR
+        elif move_forward:
+            controlled_element_speed = self.reference_speed
+        else:
+            controlled_element_speed = self._backward_speed_
         controlled_element.set_state(speed=controlled_element_speed)
\ No newline at end of file
@@ -2,13 +2,21 @@
 PIDController class module. Inherits from the Controller class. Used to give a more natural movement pattern to the opposing paddle in the simulation.
 """
 
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
 from simulation.controllers.base_controller import Controller
 from simulation.elements.base_element import Element
-from simulation.elements.paddle import Paddle
 from simulation.geometry.vector import Vector2D
 
+if TYPE_CHECKING:
+    from simulation.elements.paddle import Paddle
+
 class PIDController(Controller):
     """Base class for PIDController objects."""
+    __slots__ = ('kp', 'ki', 'kd', '_cumulative_error', '_last_error')
+
     kp: float
     ki: float
     kd: float
@@ -30,6 +38,8 @@ class PIDController(Controller):
 
 class VerticalPositionPIDController(PIDController):
     """Controls the element's vertical position based on a reference element."""
+    __slots__ = ('reference',)
+
     reference: Element
 
     def __init__(self, kp: float, ki: float, kd: float, reference: Element):
@@ -47,23 +57,20 @@ class VerticalPositionPIDController(PIDController):
         self.reference = reference
         
     def update(self, controlled_element: Paddle) -> None:
-        super().update(controlled_element)
-
         # Computes the error between the reference and the controlled element
         error = self.reference.shape.center.y - controlled_element.shape.center.y
 
         # Handles the integration part of the controller
-        self._cumulative_error += error
+        cumulative_error = self._cumulative_error + error
+        self._cumulative_error = cumulative_error
 
         # Handles the differential part of the controller
-        if self._last_error is None:
-            differential_error = 0.0
-        else:
-            differential_error = error - self._last_error
+        last_error = self._last_error
+        differential_error = 0.0 if last_error is None else error - last_error
         self._last_error = error
 
         # Computes the correction and applies it to the controlled element
-        correction = self.kp*error + self.ki*self._cumulative_error + self.kd*differential_error
+        correction = self.kp*error + self.ki*cumulative_error + self.kd*differential_error
         controlled_element.set_state(speed=Vector2D(0.0, correction))
     
 
@@ -2,16 +2,25 @@
 RandomController class module. Inherits from the Controller class. Used to compare the network's result.
 """
 
+from __future__ import annotations
+
+from math import isclose
+from typing import TYPE_CHECKING
+
 from simulation.controllers.base_controller import Controller
 from simulation.controllers.exceptions import ControllerInitializationError
-from simulation.elements.base_element import Element
-from simulation.elements.paddle import Paddle
 from simulation.geometry.vector import Vector2D
 
 from numpy.random import Generator
 
+if TYPE_CHECKING:
+    from simulation.elements.base_element import Element
+    from simulation.elements.paddle import Paddle
+
 class RandomController(Controller):
     """Base class for RandomController objects."""
+    __slots__ = ('_generator',)
+
     _generator: Generator | None
 
     def __init__(self):
@@ -33,9 +42,14 @@ class RandomController(Controller):
     
 class LinearRandomWalker(RandomController):
     """Controls the element's vertical position based on a linear random walker model."""
+    __slots__ = ('reference_speed', 'reference_probabilities', '_walker_speed_choices_', '_forward_threshold_', '_still_threshold_')
+
     reference_speed: Vector2D
     reference_probabilities: list[float]
     _random_walker_movements_: list[int] = [1, 0, -1]
+    _walker_speed_choices_: tuple[Vector2D, Vector2D, Vector2D]
+    _forward_threshold_: float
+    _still_threshold_: float
 
     def __init__(self, reference_speed: Vector2D, reference_probabilities: list[float] = [1.0/3.0, 1.0/3.0, 1.0/3.0]):
         """RandomController that controls the element's vertical position based on a linear random walker model.
@@ -49,18 +63,31 @@ class LinearRandomWalker(RandomController):
             raise ValueError(f"reference_probabilities size ({len(reference_probabilities)}) does not match the random walker possible movements ({len(self._random_walker_movements_)}).")
         if not all(isinstance(element, float) for element in reference_probabilities):
             raise TypeError("unsupported element type(s) for reference_probabilities element")
-        
+        if not isclose(sum(reference_probabilities), 1.0, abs_tol=1e-8):
+            raise ValueError(f"reference_probabilities elements ({reference_probabilities}) do not sum to one.")
+
         super().__init__()
         
         self.reference_speed = reference_speed
         self.reference_probabilities = reference_probabilities
+        self._walker_speed_choices_ = tuple(float(movement) * reference_speed for movement in self._random_walker_movements_)
+        self._forward_threshold_ = reference_probabilities[0]
+        self._still_threshold_ = reference_probabilities[0] + reference_probabilities[1]
 
     def update(self, controlled_element: Paddle) -> None:
-        super().update(controlled_element)
+        # Samples the walker's movement by inverting the cumulative distribution of the reference probabilities.
+        # The generator guard lives in the exception path, so configured walkers pay nothing for it per tick.
+        try:
+            walker_draw = self._generator.random()
+        except AttributeError:
+            raise ControllerInitializationError("generator attribute must be set before using this object")
+        if walker_draw < self._forward_threshold_:
+            random_speed = self._walker_speed_choices_[0]
+        elif walker_draw < self._still_threshold_:
+            random_speed = self._walker_speed_choices_[1]
+        else:
+            random_speed = self._walker_speed_choices_[2]
 
-        walker_choice = self._generator.choice(self._random_walker_movements_, p=self.reference_probabilities)
-        
-        random_speed = walker_choice * self.reference_speed
         controlled_element.set_state(speed=random_speed)
     
 
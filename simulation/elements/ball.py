@@ -4,15 +4,23 @@ Ball class module. Inherits from the Element class. Used to model a moving ball
 
 from __future__ import annotations
 
+from math import hypot
+
 from simulation.elements.base_element import Element
 from simulation.geometry.circle import Circle
 from simulation.geometry.vector import Vector2D
 
 class Ball(Element):
     """Simple ball object that follows an UARM and processes collisions."""
+    __slots__ = ('speed_range', '_min_speed', '_max_speed', '_min_squared_speed_', '_max_squared_speed_')
+
     shape: Circle
     speed_range: tuple[float, float]
-    
+    _min_speed: float
+    _max_speed: float
+    _min_squared_speed_: float
+    _max_squared_speed_: float
+
     def __init__(self, shape: Circle, speed: Vector2D, speed_range: tuple[float, float], acceleration: Vector2D):
         """Creates a simple ball object that follows the UARM and processes collisions. This element only allows for circular shapes. 
         A speed range tuple, ('min', 'max'), should be specified to avoid it from potentially breaking the simulation.
@@ -32,21 +40,28 @@ class Ball(Element):
         
         super().__init__(shape, speed, acceleration)
         self.speed_range = speed_range
+        self._min_speed = min_speed
+        self._max_speed = max_speed
+        self._min_squared_speed_ = min_speed*min_speed
+        self._max_squared_speed_ = max_speed*max_speed
 
     def adjust_speed(self) -> None:
         """Adjusts the ball's speed based on its speed range."""
-        min_speed, max_speed = self.speed_range
-        current_speed = self.speed.norm()
+        speed = self.speed
+        squared_speed = speed.x*speed.x + speed.y*speed.y
+
+        # Fast path: an in-range speed needs no square root at all.
+        if self._min_squared_speed_ <= squared_speed <= self._max_squared_speed_:
+            return
 
-        if current_speed < min_speed:
-            self.speed = (min_speed/current_speed) * self.speed
-        elif current_speed > max_speed:
-            self.speed = (max_speed/current_speed) * self.speed
+        current_speed = hypot(speed.x, speed.y)
+        clamped_speed = min(self._max_speed, max(self._min_speed, current_speed))
+        scale = clamped_speed/current_speed
+        self.speed = Vector2D(speed.x*scale, speed.y*scale)
 
     def set_state(self, position = None, speed = None, acceleration = None) -> Ball:
         if speed is not None:
-            min_speed, max_speed = self.speed_range            
-            if not (min_speed < speed.norm() < max_speed):
+            if not (self._min_speed < speed.norm() < self._max_speed):
                 raise ValueError("given speed value's norm is out of bound")
     
         return super().set_state(position, speed, acceleration)
@@ -6,16 +6,25 @@ The Element class defined here should not directly be used as an element of a si
 
 from __future__ import annotations
 
+from typing import Any
+
 from simulation.geometry.shape import Shape
-from simulation.geometry.vector import Vector2D
+from simulation.geometry.vector import Vector2D, ZERO_VECTOR
+
+# Per-class caches for the attribute names used by __eq__ and __repr__. Subclasses that do not declare
+# slots can carry instance-specific attributes and are left out of the caches.
+_COMPARABLE_NAMES_CACHE: dict[type, tuple[str, ...]] = {}
+_REPRESENTED_NAMES_CACHE: dict[type, tuple[str, ...]] = {}
 
 class Element:
     """Base class for all Element objects."""
+    __slots__ = ('shape', 'speed', 'acceleration')
+
     shape: Shape
     speed: Vector2D
     acceleration: Vector2D
 
-    def __init__(self, shape: Shape, speed: Vector2D = Vector2D(0.0, 0.0), acceleration: Vector2D = Vector2D(0.0, 0.0)):
+    def __init__(self, shape: Shape, speed: Vector2D = ZERO_VECTOR, acceleration: Vector2D = ZERO_VECTOR):
         """Base class for all Element objects.
             - shape: Shape object representing the shape of the element.
             - speed (optional): Point object representing the speed of the element.
@@ -32,54 +41,69 @@ class Element:
         self.speed = speed
         self.acceleration = acceleration
 
+    def _attribute_items(self) -> list[tuple[str, Any]]:
+        """Returns the element's (name, value) attribute pairs, walking __slots__ across the class hierarchy and falling
+        back on __dict__ for subclasses that do not declare slots."""
+        attribute_items = []
+        for class_ in reversed(type(self).__mro__):
+            for name in class_.__dict__.get('__slots__', ()):
+                attribute_items.append((name, getattr(self, name)))
+        instance_dict = getattr(self, '__dict__', None)
+        if instance_dict is not None:
+            attribute_items.extend(instance_dict.items())
+        return attribute_items
+
     def __eq__(self, other) -> bool:
         """Checks if two Element objects are equal."""
-        if isinstance(other, self.__class__):
-            self_filtered_dict = {key : value for key, value in self.__dict__.items() if not key.endswith('_')}
-            other_filtered_dict = {key : value for key, value in other.__dict__.items() if not key.endswith('_')}
-            return self_filtered_dict == other_filtered_dict
-        else:
+        # Exact type match: a subclass carries extra attributes the base class would not compare.
+        if type(other) is not type(self):
+            return False
+        comparable_names = _COMPARABLE_NAMES_CACHE.get(type(self))
+        if comparable_names is None:
+            comparable_names = tuple(name for name, _ in self._attribute_items() if not name.endswith('_'))
+            if not hasattr(self, '__dict__'):
+                _COMPARABLE_NAMES_CACHE[type(self)] = comparable_names
+        try:
+            return all(getattr(self, name) == getattr(other, name) for name in comparable_names)
+        except AttributeError:
             return False
 
     def __repr__(self) -> str:
         """Element object's representation."""
-        filtered_attributes = {key: value for key, value in self.__dict__.items() if not key.startswith('_')}
-        return f"{self.__class__.__name__}({', '.join(f'{key}={repr(value)}' for key, value in filtered_attributes.items())})"
-    
+        represented_names = _REPRESENTED_NAMES_CACHE.get(type(self))
+        if represented_names is None:
+            represented_names = tuple(name for name, _ in self._attribute_items() if not name.startswith('_'))
+            if not hasattr(self, '__dict__'):
+                _REPRESENTED_NAMES_CACHE[type(self)] = represented_names
+        return f"{self.__class__.__name__}({', '.join(f'{name}={repr(getattr(self, name))}' for name in represented_names)})"
+
     def __str__(self) -> str:
-        """Element object's string representation for testing purposes."""        
-        return f"{self.__class__.__name__}({self.__dict__})"
+        """Element object's string representation for testing purposes."""
+        return f"{self.__class__.__name__}({dict(self._attribute_items())})"
 
     def set_state(self, position: Vector2D | None = None, speed: Vector2D | None = None, acceleration: Vector2D | None = None) -> Element:
-        """Set the element's state to the given values. If a parameter is set to None, the element keeps its previous value for this parameter."""
+        """Set the element's state to the given values. If a parameter is set to None, the element keeps its previous value for this parameter.
+        The given values are trusted to be Vector2D objects: this method runs on the simulation's hot path with internally produced vectors."""
         if position is not None:
-            if not isinstance(position, Vector2D):
-                raise TypeError(f"unsupported parameter type(s) for position: '{type(position).__name__}'")
-            else:
-                self.shape.center = position
+            self.shape.center = position
 
         if speed is not None:
-            if not isinstance(speed, Vector2D):
-                raise TypeError(f"unsupported parameter type(s) for speed: '{type(speed).__name__}'")
-            else:
-                self.speed = speed
+            self.speed = speed
 
         if acceleration is not None:
-            if not isinstance(acceleration, Vector2D):
-                raise TypeError(f"unsupported parameter type(s) for acceleration: '{type(acceleration).__name__}'")
-            else:
-                self.acceleration = acceleration
+            self.acceleration = acceleration
 
         return self
 
     def update(self) -> None:
         """Updates the element's state based on its current state."""
-        self.shape.move_center(self.speed)
+        shape = self.shape
+        shape.center = shape.center + self.speed
         self.speed += self.acceleration
 
     def collides_with(self, other: Element) -> bool:
-        """Checks for collision between elements."""
-        if not isinstance(other, Element):
+        """Checks for collision between elements. The type guard is stripped under python -O."""
+        if __debug__ and not isinstance(other, Element):
             raise TypeError(f"unsupported parameter type(s) for other: '{type(other).__name__}'")
         return self.shape.collides_with(other.shape)
     
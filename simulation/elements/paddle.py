@@ -7,12 +7,16 @@ from __future__ import annotations
 from simulation.elements.base_element import Element
 from simulation.controllers.base_controller import Controller
 from simulation.geometry.shape import Shape
-from simulation.geometry.vector import Vector2D
+from simulation.geometry.vector import Vector2D, ZERO_VECTOR
 
 class Paddle(Element):
     """Simple paddle object that moves only on the vertical axis."""
+    __slots__ = ('controller', 'y_range', '_min_y', '_max_y')
+
     controller: Controller
     y_range: tuple[float, float]
+    _min_y: float
+    _max_y: float
 
     def __init__(self, shape: Shape, controller: Controller, y_range: tuple[float, float]):
         """Creates a paddle object, that moves only on the vertical axis. This element supports every type of shapes defined in the geometry module.
@@ -31,31 +35,45 @@ class Paddle(Element):
         super().__init__(shape)
         self.controller = controller
         self.y_range = y_range
+        self._min_y = min_y
+        self._max_y = max_y
 
     def adjust_position(self):
         """Adjusts the paddle's position based on its y range"""
-        min_y, max_y = self.y_range
-        current_y = self.shape.center.y
-
-        if current_y < min_y:
-            self.shape.move_center(Vector2D(0.0, min_y - current_y))
-            self.speed = Vector2D(0.0, 0.0)
-        elif current_y > max_y:
-            self.shape.move_center(Vector2D(0.0, max_y - current_y))
-            self.speed = Vector2D(0.0, 0.0)
-    
+        center = self.shape.center
+        current_y = center.y
+
+        if current_y < self._min_y:
+            self.shape.center = Vector2D(center.x, self._min_y)
+            self.speed = ZERO_VECTOR
+        elif current_y > self._max_y:
+            self.shape.center = Vector2D(center.x, self._max_y)
+            self.speed = ZERO_VECTOR
+
     def set_state(self, position = None, speed = None, acceleration = None) -> Paddle:
         if position is not None:
-            min_y, max_y = self.y_range
-            
-            if not (min_y < position.y < max_y):
+            if not (self._min_y < position.y < self._max_y):
                 raise ValueError("given position y value is out of bound")
     
         return super().set_state(position, speed, acceleration)
 
     def update(self) -> None:
         self.controller.update(self)
-        super().update()
-        self.adjust_position()
+
+        # Fuses the base kinematic update with adjust_position so the center is written exactly once per tick.
+        center = self.shape.center
+        speed = self.speed
+        new_x = center.x + speed.x
+        new_y = center.y + speed.y
+        self.speed = speed + self.acceleration
+
+        if new_y < self._min_y:
+            new_y = self._min_y
+            self.speed = ZERO_VECTOR
+        elif new_y > self._max_y:
+            new_y = self._max_y
+            self.speed = ZERO_VECTOR
+
+        self.shape.center = Vector2D(new_x, new_y)
 
 
@@ -5,15 +5,19 @@ Circle class module. Inherits from the Shape class.
 from math import pi, cos, sin
 from numpy.random import Generator
 
-from simulation.geometry.constants import TOLERANCE
+from simulation.geometry.constants import TOLERANCE, TOLERANCE_SQUARED
 from simulation.geometry.exceptions import CurvedEdgeError, EdgeError
 from simulation.geometry.vector import Vector2D
 from simulation.geometry.shape import Shape
 
 class Circle(Shape):
     """Defines a circular shape based on its center and its radius."""
+    __slots__ = ('radius', '_padded_radius_', '_padded_radius_squared_')
+
     radius: float
-    
+    _padded_radius_: float
+    _padded_radius_squared_: float
+
     def __init__(self, center: Vector2D, radius: float, orientation: float = 0.0, fill: str = "#FFFFFF", outline: str = "#FFFFFF"):
         """Defines a circular shape based on its center and its radius.
             - center: Point object representing the coordinates of the circle's center.
@@ -28,17 +32,21 @@ class Circle(Shape):
             raise ValueError("Circle's radius must be bigger then zero.")
         
         self.radius = float(radius)
-        
+        self._padded_radius_ = self.radius + TOLERANCE
+        self._padded_radius_squared_ = self._padded_radius_*self._padded_radius_
+
     def contains_point(self, global_point: Vector2D) -> bool:
-        return (global_point - self.center).squared_norm() <= (self.radius + TOLERANCE) **2.0
+        return (global_point - self.center).squared_norm() <= self._padded_radius_squared_
 
     def collides_with(self, shape: Shape) -> bool:
-        if isinstance(shape, Circle):
-            return (shape.center - self.center).squared_norm() <= (self.radius + shape.radius + 2.0*TOLERANCE)**2.0
-        
+        # Identity check first: Circle is a leaf type in practice, so the common case skips the MRO walk.
+        if shape.__class__ is Circle or isinstance(shape, Circle):
+            collision_distance = self._padded_radius_ + shape._padded_radius_
+            return (shape.center - self.center).squared_norm() <= collision_distance*collision_distance
+
         elif isinstance(shape, Shape):
             return shape.collides_with(self)
-        
+
         else:
             raise TypeError(f"unsupported parameter type(s) for shape: '{type(shape).__name__}'")
         
@@ -49,8 +57,7 @@ class Circle(Shape):
         if not isinstance(generator, Generator):
             raise TypeError(f"unsupported parameter type(s) for generator: '{type(generator).__name__}'")
         
-        radius = generator.uniform(0.0, self.radius)
-        orientation = generator.uniform(0.0, 2.0*pi)
+        radius, orientation = generator.uniform(low=(0.0, 0.0), high=(self.radius, 2.0*pi))
 
         return self.translate_to_global(Vector2D(radius*cos(orientation), radius*sin(orientation)))
 
@@ -58,7 +65,7 @@ class Circle(Shape):
         return (self.radius/local_point.norm()) * local_point
     
     def get_edge_normal_vector(self, local_point: Vector2D) -> Vector2D:
-        if local_point.squared_norm() - self.radius ** 2.0 <= TOLERANCE ** 2.0:
+        if local_point.squared_norm() - self.radius*self.radius <= TOLERANCE_SQUARED:
             return local_point.unit_vector()
         else:
             raise EdgeError("Given point is not on this shape's perimeter. It won't be associated to any normal vector.")
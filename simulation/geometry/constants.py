@@ -2,4 +2,5 @@
 Geometry constants module.
 """
 
-TOLERANCE = 1e-8
\ No newline at end of file
+TOLERANCE = 1e-8
+TOLERANCE_SQUARED = TOLERANCE * TOLERANCE
@@ -14,12 +14,19 @@ SHAPE_EDGE_COUNT = 4
 
 class Rectangle(Shape):
     """Creates a rectangular shape based on its center, its width and its height."""
+    __slots__ = ('width', 'height', '_half_width_', '_half_height_', '_padded_half_width_', '_padded_half_height_',
+                 '_perimeter_points', '_perimeter_cache_', '_edges', '_edge_normal_vectors')
+
     width: float
     height: float
+    _half_width_: float
+    _half_height_: float
+    _padded_half_width_: float
+    _padded_half_height_: float
     _perimeter_points: list[Vector2D]
+    _perimeter_cache_: tuple[float, float, float, list[Vector2D]] | None
     _edges: list[tuple[Vector2D, Vector2D]]
     _edge_normal_vectors: list[Vector2D]
-    _edge_reference_vectors: list[Vector2D]
 
     def __init__(self, center: Vector2D, width: float, height: float, orientation: float = 0.0, fill: str = "#FFFFFF", outline: str = "#FFFFFF"):
         """Creates a rectangular shape based on its center, its width and its height.
@@ -40,82 +47,146 @@ class Rectangle(Shape):
         self.width = float(width)
         self.height = float(height)
 
-        self._perimeter_points = [Vector2D(self.width/2.0, self.height/2.0), Vector2D(self.width/2.0, -self.height/2.0),
-                                 Vector2D(-self.width/2.0, -self.height/2.0), Vector2D(-self.width/2.0, self.height/2.0)]
+        half_width = self.width/2.0
+        half_height = self.height/2.0
+        self._half_width_ = half_width
+        self._half_height_ = half_height
+        self._padded_half_width_ = half_width + TOLERANCE
+        self._padded_half_height_ = half_height + TOLERANCE
+
+        self._perimeter_points = [Vector2D(half_width, half_height), Vector2D(half_width, -half_height),
+                                 Vector2D(-half_width, -half_height), Vector2D(-half_width, half_height)]
+        self._perimeter_cache_ = None
 
         self._edges = [(self._perimeter_points[i-1], self._perimeter_points[i]) for i in range(SHAPE_EDGE_COUNT)]
-        self._edge_normal_vectors = [(point2 - point1).rotate(90.0).unit_vector().round(8) for point1, point2 in self._edges]
-        self._edge_reference_vectors = [perimeter_point.projection(normal_vector).round(8) for perimeter_point, normal_vector in zip(self._perimeter_points, self._edge_normal_vectors)]
+        # In local coordinates the edge normals are the four axis directions (top, right, bottom,
+        # left), written in closed form instead of being derived edge by edge.
+        self._edge_normal_vectors = [Vector2D(0.0, 1.0), Vector2D(1.0, 0.0), Vector2D(0.0, -1.0), Vector2D(-1.0, 0.0)]
 
     def contains_point(self, global_point: Vector2D) -> bool:
         local_point = self.translate_to_local(global_point)
 
-        return (-(self.width/2.0 + TOLERANCE) <= local_point.x <= self.width/2.0 + TOLERANCE 
-            and -(self.height/2.0 + TOLERANCE) <= local_point.y <= self.height/2.0 + TOLERANCE) 
+        return (-self._padded_half_width_ <= local_point.x <= self._padded_half_width_
+            and -self._padded_half_height_ <= local_point.y <= self._padded_half_height_)
 
     def collides_with(self, shape: Shape) -> bool:
         if isinstance(shape, Circle):
-            if self.contains_point(shape.center):
+            # The circle's center is translated to local coordinates exactly once and reused for both
+            # the containment test and the closest-point query.
+            local_circle_center = self.translate_to_local(shape.center)
+            if (-self._padded_half_width_ <= local_circle_center.x <= self._padded_half_width_
+            and -self._padded_half_height_ <= local_circle_center.y <= self._padded_half_height_):
                 return True
             else:
-                local_circle_center = self.translate_to_local(shape.center)
                 closest_point = self.get_closest_point(local_circle_center)
 
-                # Checks if the distance from the closest point to the circle's center is smaller than its radius.
-                return (local_circle_center - closest_point).squared_norm() <= (shape.radius)**2.0
+                # Checks if the distance from the closest point to the circle's center is smaller than
+                # its radius, on plain floats to avoid an intermediate difference vector.
+                dx = local_circle_center.x - closest_point.x
+                dy = local_circle_center.y - closest_point.y
+                return dx*dx + dy*dy <= shape.radius*shape.radius
         
         elif isinstance(shape, Shape):
-            return (any([self.contains_point(corner) for corner in shape.get_perimeter_points()]) 
-                 or any([shape.contains_point(corner) for corner in self.get_perimeter_points()]))
+            self_corners = self.get_perimeter_points()
+            shape_corners = shape.get_perimeter_points()
+
+            # Axis-aligned bounding box pre-check: far-apart shapes are rejected with a few float
+            # compares before any corner is rotated into local coordinates.
+            self_xs = [corner.x for corner in self_corners]
+            self_ys = [corner.y for corner in self_corners]
+            shape_xs = [corner.x for corner in shape_corners]
+            shape_ys = [corner.y for corner in shape_corners]
+            if (max(self_xs) + TOLERANCE < min(shape_xs) or max(shape_xs) + TOLERANCE < min(self_xs)
+             or max(self_ys) + TOLERANCE < min(shape_ys) or max(shape_ys) + TOLERANCE < min(self_ys)):
+                return False
+
+            # Two axis-aligned rectangles are exactly their bounding boxes, so surviving the pre-check
+            # already proves an overlap — including crossing overlaps where neither rectangle contains
+            # a corner of the other.
+            if isinstance(shape, Rectangle) and self.orientation % 90.0 == 0.0 and shape.orientation % 90.0 == 0.0:
+                return True
+
+            # The corner tests against this rectangle share a single set of rotation coefficients and
+            # run on plain floats, skipping the per-corner translate_to_local call and its
+            # intermediate Vector2D allocations.
+            cos_angle, sin_angle = self._get_orientation_trig()
+            center = self.center
+            bound_x = self._padded_half_width_
+            bound_y = self._padded_half_height_
+            for corner in shape_corners:
+                offset_x = corner.x - center.x
+                offset_y = corner.y - center.y
+                if (-bound_x <= offset_x*cos_angle + offset_y*sin_angle <= bound_x
+                and -bound_y <= -offset_x*sin_angle + offset_y*cos_angle <= bound_y):
+                    return True
+
+            # Generator form so the remaining corner checks stop at the first hit.
+            return any(shape.contains_point(corner) for corner in self_corners)
         
         else:
             raise TypeError(f"unsupported parameter type(s) for shape: '{type(shape).__name__}'")
         
-    def get_perimeter_points(self) -> list[Vector2D]:        
-        return [self.translate_to_global(point) for point in self._perimeter_points]
+    def get_perimeter_points(self) -> list[Vector2D]:
+        # The global corners only depend on the center and the orientation, so they are cached and
+        # revalidated against the current pose, like the trig cache in Shape.
+        center = self.center
+        cache = self._perimeter_cache_
+        if cache is not None and cache[0] == center.x and cache[1] == center.y and cache[2] == self.orientation:
+            return cache[3]
+        global_points = [self.translate_to_global(point) for point in self._perimeter_points]
+        self._perimeter_cache_ = (center.x, center.y, self.orientation, global_points)
+        return global_points
     
     def get_random_point(self, generator: Generator) -> Vector2D:
         if not isinstance(generator, Generator):
             raise TypeError(f"unsupported parameter type(s) for generator: '{type(generator).__name__}'")
         
-        x = generator.uniform(-self.width/2.0, self.width/2.0)
-        y = generator.uniform(-self.height/2.0, self.height/2.0)
+        # Both coordinates are drawn through a single generator call, halving the Python/C crossings.
+        x, y = generator.uniform(low=(-self._half_width_, -self._half_height_), high=(self._half_width_, self._half_height_))
 
         return self.translate_to_global(Vector2D(x, y))
     
     def get_closest_point(self, local_point: Vector2D) -> Vector2D:
+        half_width = self._half_width_
+        half_height = self._half_height_
+
         # Calculates the closest x and y coordinates on the rectangle's perimeter.
-        closest_x = max(-self.width / 2.0, min(local_point.x, self.width / 2.0))
-        closest_y = max(-self.height / 2.0, min(local_point.y, self.height / 2.0))
-
-        # Checks if the point is inside the rectangle.
-        if self.contains_point(local_point):
-            
-            # Finds distances to each edge.
-            dist_left = abs(local_point.x - (-self.width / 2.0))
-            dist_right = abs(local_point.x - (self.width / 2.0))
-            dist_top = abs(local_point.y - (self.height / 2.0))
-            dist_bottom = abs(local_point.y - (-self.height / 2.0))
-            
-            # Determines the minimum distances on each axis.
-            min_dist_x = min(dist_left, dist_right)
-            min_dist_y = min(dist_top, dist_bottom)
-
-            # Prioritizes the vertical edges over the horizontal ones.
-            if min_dist_x <= min_dist_y:
-                # Prioritizes the left edge over the right one.
-                closest_x = -self.width / 2.0 if dist_left < dist_right else self.width / 2.0
+        closest_x = max(-half_width, min(local_point.x, half_width))
+        closest_y = max(-half_height, min(local_point.y, half_height))
+
+        # Checks if the point is inside the rectangle, directly on the local coordinates: the former
+        # call to contains_point re-applied the global-to-local translation to a point that is
+        # already local, paying a second rotation and testing the wrong point for moved or rotated
+        # rectangles.
+        if (-self._padded_half_width_ <= local_point.x <= self._padded_half_width_
+        and -self._padded_half_height_ <= local_point.y <= self._padded_half_height_):
+
+            # Signed distances to the nearest vertical and horizontal edges.
+            dist_x = half_width - abs(local_point.x)
+            dist_y = half_height - abs(local_point.y)
+
+            # Prioritizes the vertical edges over the horizontal ones, and the positive edge when the
+            # point sits exactly on an axis, matching the previous four-distance formulation.
+            if dist_x <= dist_y:
+                closest_x = -half_width if local_point.x < 0.0 else half_width
             else:
-                # Prioritizes the top edge over the bottom one.
-                closest_y = -self.height / 2.0 if dist_bottom < dist_top else self.height / 2.0
+                closest_y = -half_height if local_point.y < 0.0 else half_height
 
         return Vector2D(closest_x, closest_y)
     
     def get_edge_normal_vector(self, local_point: Vector2D) -> Vector2D:
-        for edge, normal_vector, reference_vector in zip(self._edges, self._edge_normal_vectors, self._edge_reference_vectors):
-            if (min(edge[0].x, edge[1].x) - TOLERANCE <= local_point.x <= max(edge[0].x, edge[1].x) + TOLERANCE
-            and min(edge[0].y, edge[1].y) - TOLERANCE <= local_point.y <= max(edge[0].y, edge[1].y) + TOLERANCE):
-                if local_point.projection(normal_vector) == reference_vector:
-                    return normal_vector
-        else:
-            raise EdgeError("Given point is not on this shape's perimeter. It can't be associated to any edges.")
\ No newline at end of file
+        x = local_point.x
+        y = local_point.y
+
+        # In local coordinates each edge reduces to one interval check plus one distance-to-edge
+        # check; the edges are tested in the same order as the precomputed edge list (top, right,
+        # bottom, left) so corner points keep resolving to the same normal as the former linear scan.
+        if -self._padded_half_width_ <= x <= self._padded_half_width_ and abs(y - self._half_height_) <= TOLERANCE:
+            return self._edge_normal_vectors[0]
+        if -self._padded_half_height_ <= y <= self._padded_half_height_ and abs(x - self._half_width_) <= TOLERANCE:
+            return self._edge_normal_vectors[1]
+        if -self._padded_half_width_ <= x <= self._padded_half_width_ and abs(y + self._half_height_) <= TOLERANCE:
+            return self._edge_normal_vectors[2]
+        if -self._padded_half_height_ <= y <= self._padded_half_height_ and abs(x + self._half_width_) <= TOLERANCE:
+            return self._edge_normal_vectors[3]
+        raise EdgeError("Given point is not on this shape's perimeter. It can't be associated to any edges.")
\ No newline at end of file
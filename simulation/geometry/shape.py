@@ -6,19 +6,34 @@ The Shape class defined here should not directly be used and will make the simul
 
 from __future__ import annotations
 
+from math import cos, radians, sin
 from numpy.random import Generator
+from typing import Any
 import re
 
 from simulation.geometry.vector import Vector2D
 
 HEX_PATTERN = r"^#([A-Fa-f0-9]{6})$"
+_HEX_RE = re.compile(HEX_PATTERN)
+
+# Colors that already passed validation. Simulations rebuild shapes far more often than they
+# introduce new colors, so validation is usually a single set lookup.
+_VALIDATED_COLORS_CACHE: set[str] = set()
+
+# Per-class caches for the attribute names used by __eq__ and __repr__. Subclasses that do not
+# declare slots can carry instance-specific attributes and are left out of the caches.
+_COMPARABLE_NAMES_CACHE: dict[type, tuple[str, ...]] = {}
+_REPRESENTED_NAMES_CACHE: dict[type, tuple[str, ...]] = {}
 
 class Shape:
     """Base class for all Shape objects."""
+    __slots__ = ('center', 'orientation', 'fill', 'outline', '_trig_cache_')
+
     center: Vector2D
     orientation: float
     fill: str
     outline: str
+    _trig_cache_: tuple[float, float, float]
 
     def __init__(self, center: Vector2D, orientation: float, fill: str, outline: str):
         """Base class for all Shape objects.
@@ -29,37 +44,71 @@ class Shape:
         
         if not isinstance(center, Vector2D):
             raise TypeError(f"unsupported parameter type(s) for center: '{type(center).__name__}'")
-        if not bool(re.match(HEX_PATTERN, str(fill))):
-            raise ValueError(f"Unsupported hexadecimal pattern for fill ({fill}).")
-        if not bool(re.match(HEX_PATTERN, str(outline))):
-            raise ValueError(f"Unsupported hexadecimal pattern for outline ({outline}).")
-        
+        fill = str(fill)
+        outline = str(outline)
+        if fill not in _VALIDATED_COLORS_CACHE:
+            if _HEX_RE.match(fill) is None:
+                raise ValueError(f"Unsupported hexadecimal pattern for fill ({fill}).")
+            _VALIDATED_COLORS_CACHE.add(fill)
+        if outline not in _VALIDATED_COLORS_CACHE:
+            if _HEX_RE.match(outline) is None:
+                raise ValueError(f"Unsupported hexadecimal pattern for outline ({outline}).")
+            _VALIDATED_COLORS_CACHE.add(outline)
+
         self.center = center
         self.orientation = float(orientation)
-        self.fill = str(fill)
-        self.outline = str(outline)
+        self.fill = fill
+        self.outline = outline
+
+        angle = radians(self.orientation)
+        self._trig_cache_ = (self.orientation, cos(angle), sin(angle))
+
+    def _attribute_items(self) -> list[tuple[str, Any]]:
+        """Returns the shape's (name, value) attribute pairs, walking __slots__ across the class hierarchy and falling
+        back on __dict__ for subclasses that do not declare slots."""
+        attribute_items = []
+        for class_ in reversed(type(self).__mro__):
+            for name in class_.__dict__.get('__slots__', ()):
+                attribute_items.append((name, getattr(self, name)))
+        instance_dict = getattr(self, '__dict__', None)
+        if instance_dict is not None:
+            attribute_items.extend(instance_dict.items())
+        return attribute_items
 
     def __eq__(self, other) -> bool:
         """Checks if two Shape objects are equal."""
-        if isinstance(other, self.__class__):
-            self_filtered_dict = {key : value for key, value in self.__dict__.items() if not key.endswith('_')}
-            other_filtered_dict = {key : value for key, value in other.__dict__.items() if not key.endswith('_')}
-            return self_filtered_dict == other_filtered_dict
-        else:
+        # Exact type match: a subclass carries extra attributes the base class would not compare.
+        if type(other) is not type(self):
             return False
-        
+        comparable_names = _COMPARABLE_NAMES_CACHE.get(type(self))
+        if comparable_names is None:
+            comparable_names = tuple(name for name, _ in self._attribute_items() if not name.endswith('_'))
+            if not hasattr(self, '__dict__'):
+                _COMPARABLE_NAMES_CACHE[type(self)] = comparable_names
+        try:
+            return all(getattr(self, name) == getattr(other, name) for name in comparable_names)
+        except AttributeError:
+            return False
+
     def __repr__(self) -> str:
         """Shape object's representation."""
-        filtered_attributes = {key: value for key, value in self.__dict__.items() if not key.startswith('_')}
-        return f"{self.__class__.__name__}({', '.join(f'{key}={repr(value)}' for key, value in filtered_attributes.items())})"
-    
+        represented_names = _REPRESENTED_NAMES_CACHE.get(type(self))
+        if represented_names is None:
+            represented_names = tuple(name for name, _ in self._attribute_items() if not name.startswith('_'))
+            if not hasattr(self, '__dict__'):
+                _REPRESENTED_NAMES_CACHE[type(self)] = represented_names
+        return f"{self.__class__.__name__}({', '.join(f'{name}={repr(getattr(self, name))}' for name in represented_names)})"
+
     def __str__(self) -> str:
-        """Shape object's string representation for testing purposes."""        
-        return f"{self.__class__.__name__}({self.__dict__})"
-    
+        """Shape object's string representation for testing purposes."""
+        return f"{self.__class__.__name__}({dict(self._attribute_items())})"
+
     def copy(self) -> Shape:
         """Returns a copy of the object as a new instance of the same class."""
-        return eval(repr(self))
+        # The public attributes mirror the constructor's keyword parameters — the same property that
+        # makes repr eval-constructible — so the copy is built directly, skipping the parse and
+        # compile round trip of the former eval(repr(self)).
+        return self.__class__(**{name: value for name, value in self._attribute_items() if not name.startswith('_')})
 
     def move_center(self, translation: Vector2D) -> Shape:
         """Moves the center of this shape by a given translation vector, represented by a Point object."""
@@ -71,13 +120,38 @@ class Shape:
         self.orientation += float(angle)
         return self
 
+    def _get_orientation_trig(self) -> tuple[float, float]:
+        """Returns the (cos, sin) pair of the shape's orientation, cached between calls and refreshed when the orientation changes."""
+        orientation, cos_angle, sin_angle = self._trig_cache_
+        if orientation != self.orientation:
+            angle = radians(self.orientation)
+            cos_angle = cos(angle)
+            sin_angle = sin(angle)
+            self._trig_cache_ = (self.orientation, cos_angle, sin_angle)
+        return cos_angle, sin_angle
+
     def translate_to_local(self, global_point: Vector2D) -> Vector2D:
         """Translates a point from the simulation's global coordinates to the shape's local coordinates."""
-        return (global_point - self.center).rotate(-self.orientation)
+        cos_angle, sin_angle = self._get_orientation_trig()
+        center = self.center
+        offset_x = global_point.x - center.x
+        offset_y = global_point.y - center.y
+        # Rotation by -orientation: cos(-a) = cos(a) and sin(-a) = -sin(a). The subtraction and
+        # rotation are fused so the call allocates a single Vector2D.
+        local_point = Vector2D.__new__(Vector2D)
+        local_point.x = offset_x*cos_angle + offset_y*sin_angle
+        local_point.y = -offset_x*sin_angle + offset_y*cos_angle
+        return local_point
 
     def translate_to_global(self, local_point: Vector2D) -> Vector2D:
         """Translates a point from the shape's local coordinates to the simulation's global coordinates."""
-        return local_point.rotate(self.orientation) + self.center
+        cos_angle, sin_angle = self._get_orientation_trig()
+        center = self.center
+        # The rotation and the translation back to global coordinates are fused into one allocation.
+        global_point = Vector2D.__new__(Vector2D)
+        global_point.x = local_point.x*cos_angle - local_point.y*sin_angle + center.x
+        global_point.y = local_point.x*sin_angle + local_point.y*cos_angle + center.y
+        return global_point
     
     def contains_point(self, global_point: Vector2D) -> bool:
         """Checks if a global Point object lies inside this shape."""
@@ -2,7 +2,7 @@
 Triangle class module. Inherits from the Shape class.
 """
 
-from math import atan, degrees, tan
+from math import atan, degrees, hypot, tan
 from numpy.random import Generator
 
 from simulation.geometry.circle import Circle
@@ -15,12 +15,22 @@ SHAPE_EDGE_COUNT = 3
 
 class IsoscelesTriangle(Shape):
     """Creates a isosceles triangular shape based on its center, its base and its height."""
+    __slots__ = ('base', 'height', '_perimeter_points', '_perimeter_cache_', '_bounding_radius_',
+                 '_barycentric_coefficients_', '_incenter_offset_', '_bisected_angle_degrees_',
+                 '_edges', '_edge_normal_vectors', '_edge_bounds_', '_edge_offsets_')
+
     base: float
     height: float
     _perimeter_points: list[Vector2D]
+    _perimeter_cache_: tuple[float, float, float, list[Vector2D]] | None
     _edges: list[tuple[Vector2D, Vector2D]]
     _edge_normal_vectors: list[Vector2D]
-    _edge_reference_vectors: list[Vector2D]
+    _incenter_offset_: Vector2D
+    _bisected_angle_degrees_: float
+    _edge_bounds_: list[tuple[float, float, float, float]]
+    _edge_offsets_: list[float]
+    _barycentric_coefficients_: tuple[float, float, float, float, float]
+    _bounding_radius_: float
 
     def __init__(self, center: Vector2D, base: float, height: float, orientation: float = 0.0, fill: str = "#FFFFFF", outline: str = "#FFFFFF"):
         """Creates isosceles triangular shape based on its center, its base and its height.
@@ -44,25 +54,53 @@ class IsoscelesTriangle(Shape):
         self._perimeter_points = [Vector2D(self.height/2.0, 0.0),
                                   Vector2D(-self.height/2.0, -self.base/2.0),
                                   Vector2D(-self.height/2.0, self.base/2.0)]
+        self._perimeter_cache_ = None
         
-        self._edges = [(self._perimeter_points[i-1], self._perimeter_points[i]) for i in range(SHAPE_EDGE_COUNT)]
-        self._edge_normal_vectors = [(point2 - point1).rotate(90.0).unit_vector() for point1, point2 in self._edges]
-        self._edge_reference_vectors = [perimeter_point.projection(normal_vector) for perimeter_point, normal_vector in zip(self._perimeter_points, self._edge_normal_vectors)]
+        # Radius of the smallest circle around the center containing the whole triangle, used as a
+        # broad-phase rejection in collides_with.
+        self._bounding_radius_ = max(point.norm() for point in self._perimeter_points)
 
-    def get_barycentric_coordinates(self, local_point: Vector2D) -> list[float]:
-        """Returns the barycentric coordinates of the given point, using the triangle's three vertices as base."""
+        # Precomputed for get_barycentric_coordinates: the linear system's coefficients and the
+        # reciprocal of its determinant only depend on the vertices.
         v0, v1, v2 = self._perimeter_points
-
-        # Defines a linear system with the condition on the sum of the lambdas. See references for more explications.
         a1 = v1 - v0
         a2 = v2 - v0
-        b = local_point - v0
+        self._barycentric_coefficients_ = (a1.x, a1.y, a2.x, a2.y, 1.0/(a1.x*a2.y - a1.y*a2.x))
 
-        # Uses Cramer's rule in 2D to quickly solve the linear system.
-        det_a = a1.x*a2.y - a1.y*a2.x
+        # Precomputed for get_closest_point: the offset between the used triangle center and its
+        # incentre, and the bisected apex angle, both fixed by base and height.
+        bisected_angle_rad = atan(2.0*self.height/self.base)/2.0
+        self._incenter_offset_ = Vector2D((self.height - self.base*tan(bisected_angle_rad))/2.0, 0.0)
+        self._bisected_angle_degrees_ = degrees(bisected_angle_rad)
+
+        self._edges = [(self._perimeter_points[i-1], self._perimeter_points[i]) for i in range(SHAPE_EDGE_COUNT)]
 
-        lambda1 = (b.x*a2.y - b.y*a2.x)/(det_a)
-        lambda2 = (a1.x*b.y - a1.y*b.x)/(det_a)
+        # Unit normals, padded local bounding boxes and edge-line offsets along the normals, derived
+        # directly from the edge coordinates (a 90-degree rotation maps (x, y) to (-y, x)) without
+        # intermediate rotated or projected vectors.
+        self._edge_normal_vectors = []
+        self._edge_bounds_ = []
+        self._edge_offsets_ = []
+        for point1, point2 in self._edges:
+            edge_length = hypot(point2.x - point1.x, point2.y - point1.y)
+            normal_vector = Vector2D((point1.y - point2.y)/edge_length, (point2.x - point1.x)/edge_length)
+            self._edge_normal_vectors.append(normal_vector)
+            self._edge_bounds_.append((min(point1.x, point2.x) - TOLERANCE, max(point1.x, point2.x) + TOLERANCE,
+                                       min(point1.y, point2.y) - TOLERANCE, max(point1.y, point2.y) + TOLERANCE))
+            self._edge_offsets_.append(point2.x*normal_vector.x + point2.y*normal_vector.y)
+
+    def get_barycentric_coordinates(self, local_point: Vector2D) -> list[float]:
+        """Returns the barycentric coordinates of the given point, using the triangle's three vertices as base.
+        The linear system's coefficients are precomputed in __init__. See references for more explications."""
+        a1_x, a1_y, a2_x, a2_y, inverse_det_a = self._barycentric_coefficients_
+
+        v0 = self._perimeter_points[0]
+        b_x = local_point.x - v0.x
+        b_y = local_point.y - v0.y
+
+        # Uses Cramer's rule in 2D to quickly solve the linear system.
+        lambda1 = (b_x*a2_y - b_y*a2_x)*inverse_det_a
+        lambda2 = (a1_x*b_y - a1_y*b_x)*inverse_det_a
 
         # Solves for lambda zero with the condition on the sum of the lambdas.
         lambda0 = 1.0 - lambda1 - lambda2
@@ -77,24 +115,57 @@ class IsoscelesTriangle(Shape):
     
     def collides_with(self, shape: Shape) -> bool:
         if isinstance(shape, Circle):
+            # Broad-phase rejection: a circle farther from the center than the bounding radius plus
+            # its own radius cannot touch the triangle, whatever the orientation.
+            dx = shape.center.x - self.center.x
+            dy = shape.center.y - self.center.y
+            collision_distance = self._bounding_radius_ + shape._padded_radius_
+            if dx*dx + dy*dy > collision_distance*collision_distance:
+                return False
+
             if self.contains_point(shape.center):
                 return True
             else:                
                 local_circle_center = self.translate_to_local(shape.center)
                 closest_point = self.get_closest_point(local_circle_center)
 
-                # Checks if the distance from the closest point to the circle's center is smaller than its radius.
-                return (local_circle_center - closest_point).squared_norm() <= (shape.radius)**2.0
+                # Checks if the distance from the closest point to the circle's center is smaller than
+                # its radius, on plain floats to avoid an intermediate difference vector.
+                dx = local_circle_center.x - closest_point.x
+                dy = local_circle_center.y - closest_point.y
+                return dx*dx + dy*dy <= shape.radius*shape.radius
         
         elif isinstance(shape, Shape):
-            return (any([self.contains_point(corner) for corner in shape.get_perimeter_points()]) 
-                 or any([shape.contains_point(corner) for corner in self.get_perimeter_points()]))
+            self_corners = self.get_perimeter_points()
+            shape_corners = shape.get_perimeter_points()
+
+            # Axis-aligned bounding box pre-check, as in Rectangle.collides_with: far-apart shapes
+            # are rejected with a few float compares before any barycentric test runs.
+            self_xs = [corner.x for corner in self_corners]
+            self_ys = [corner.y for corner in self_corners]
+            shape_xs = [corner.x for corner in shape_corners]
+            shape_ys = [corner.y for corner in shape_corners]
+            if (max(self_xs) + TOLERANCE < min(shape_xs) or max(shape_xs) + TOLERANCE < min(self_xs)
+             or max(self_ys) + TOLERANCE < min(shape_ys) or max(shape_ys) + TOLERANCE < min(self_ys)):
+                return False
+
+            # Generator form so the corner checks stop at the first hit.
+            return (any(self.contains_point(corner) for corner in shape_corners)
+                 or any(shape.contains_point(corner) for corner in self_corners))
         
         else:
             raise TypeError(f"unsupported parameter type(s) for shape: '{type(shape).__name__}'")
         
     def get_perimeter_points(self) -> list[Vector2D]:
-        return [self.translate_to_global(point) for point in self._perimeter_points]
+        # The global corners only depend on the center and the orientation, so they are cached and
+        # revalidated against the current pose, like the trig cache in Shape.
+        center = self.center
+        cache = self._perimeter_cache_
+        if cache is not None and cache[0] == center.x and cache[1] == center.y and cache[2] == self.orientation:
+            return cache[3]
+        global_points = [self.translate_to_global(point) for point in self._perimeter_points]
+        self._perimeter_cache_ = (center.x, center.y, self.orientation, global_points)
+        return global_points
     
     def get_random_point(self, generator: Generator) -> Vector2D:
         if not isinstance(generator, Generator):
@@ -109,15 +180,11 @@ class IsoscelesTriangle(Shape):
         return self.translate_to_global(lambdas[0]*v0 + lambdas[1]*v1 + lambdas[2]*v2)
 
     def get_closest_point(self, local_point: Vector2D) -> Vector2D:
-        # Computes the offset between the used triangle center and its incentre.
-        bisected_angle_rad = atan(2.0*self.height/self.base)/2.0
-        offset = Vector2D((self.height - self.base*tan(bisected_angle_rad))/2.0, 0.0)
-
         # Checks the orientation of the circle's center compared to the triangle's incentre.
-        center_orientation = (local_point + offset).orientation()
+        center_orientation = (local_point + self._incenter_offset_).orientation()
 
         # Chooses which edge to consider based on the center's orientation.
-        bisected_angle_degrees = degrees(bisected_angle_rad)
+        bisected_angle_degrees = self._bisected_angle_degrees_
         if center_orientation <= bisected_angle_degrees + 90.0:
             v0, v1 = self._perimeter_points[2], self._perimeter_points[0]
         elif center_orientation >= 270.0 - bisected_angle_degrees:
@@ -125,23 +192,28 @@ class IsoscelesTriangle(Shape):
         else:
             v0, v1 = self._perimeter_points[1], self._perimeter_points[2]
 
-        # Computes the projection of the vector v0 → local_circle center on v0 → v1.
-        point_vector = local_point - v0
-        edge_vector = v1 - v0
-        
-        dot_product = point_vector.x*edge_vector.x + point_vector.y*edge_vector.y
+        # Computes the projection of the vector v0 → local_circle center on v0 → v1, on plain floats
+        # to avoid the intermediate difference vectors.
+        edge_x = v1.x - v0.x
+        edge_y = v1.y - v0.y
+        dot_product = (local_point.x - v0.x)*edge_x + (local_point.y - v0.y)*edge_y
 
         # Picks the closest point to the circle from the triangle's edge.
-        k = max(0.0, min(dot_product/edge_vector.squared_norm(), 1.0))
-        closest_point = k * edge_vector + v0
+        k = max(0.0, min(dot_product/(edge_x*edge_x + edge_y*edge_y), 1.0))
+        closest_point = Vector2D.__new__(Vector2D)
+        closest_point.x = k*edge_x + v0.x
+        closest_point.y = k*edge_y + v0.y
 
         return closest_point
     
     def get_edge_normal_vector(self, local_point) -> Vector2D:
-        for edge, normal_vector, reference_vector in zip(self._edges, self._edge_normal_vectors, self._edge_reference_vectors):
-            if (min(edge[0].x, edge[1].x) - TOLERANCE <= local_point.x <= max(edge[0].x, edge[1].x) + TOLERANCE
-            and min(edge[0].y, edge[1].y) - TOLERANCE <= local_point.y <= max(edge[0].y, edge[1].y) + TOLERANCE):
-                if local_point.projection(normal_vector) == reference_vector:
+        x = local_point.x
+        y = local_point.y
+        for (min_x, max_x, min_y, max_y), normal_vector, offset in zip(self._edge_bounds_, self._edge_normal_vectors, self._edge_offsets_):
+            if min_x <= x <= max_x and min_y <= y <= max_y:
+                # The normal is unit length, so the former projection equality reduces to comparing
+                # the point's signed distance along the normal with the edge's offset.
+                if abs(x*normal_vector.x + y*normal_vector.y - offset) <= TOLERANCE:
                     return normal_vector
         else:
             raise EdgeError("Given point is not on this shape's perimeter. It can't be associated to any edges.")
\ No newline at end of file
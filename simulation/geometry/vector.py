@@ -3,12 +3,22 @@ Point class module.
 """
 
 from __future__ import annotations
-from math import atan, cos, degrees, radians, sin, sqrt
+from functools import lru_cache
+from math import atan2, cos, degrees, hypot, radians, sin
 
-from simulation.geometry.constants import TOLERANCE
+from simulation.geometry.constants import TOLERANCE_SQUARED
+
+@lru_cache(maxsize=256)
+def _rotation_coefficients(angle: float) -> tuple[float, float]:
+    """Returns the (cos, sin) pair for a rotation by the given angle (in degrees). Cached because rotations mostly
+    recur over a small set of angles (paddle orientations, wall reflections)."""
+    angle = radians(angle)
+    return cos(angle), sin(angle)
 
 class Vector2D:
     """Defines a 2D vector."""
+    __slots__ = ('x', 'y')
+
     x: float
     y: float
 
@@ -20,7 +30,7 @@ class Vector2D:
     def __eq__(self, other) -> bool:
         """Two vectors are defined equal if they are relatively close one from another."""
         if isinstance(other, self.__class__):
-            return (self - other).squared_norm() <= TOLERANCE ** 2.0
+            return (self - other).squared_norm() <= TOLERANCE_SQUARED
         else:
             return False
 
@@ -28,26 +38,31 @@ class Vector2D:
         return not self.__eq__(other)
 
     def __add__(self, other) -> Vector2D:
-        """Follows the definition of addition between two vectors."""
-        if isinstance(other, Vector2D):
-            x = self.x + other.x
-            y = self.y + other.y
-            return Vector2D(x, y)
-        else:
+        """Follows the definition of addition between two vectors. The type guard is stripped under python -O."""
+        if __debug__ and not isinstance(other, Vector2D):
             raise TypeError(f"unsupported operand type(s) for +: '{type(self).__name__}' and '{type(other).__name__}'")
+        # Hot path: the coordinates are already floats, so the result is built through __new__ to skip
+        # __init__'s coercion.
+        result = Vector2D.__new__(Vector2D)
+        result.x = self.x + other.x
+        result.y = self.y + other.y
+        return result
 
     def __neg__(self) -> Vector2D:
         """Follows the definition of opposite for a vector."""
-        return Vector2D(-self.x, -self.y)
-    
+        result = Vector2D.__new__(Vector2D)
+        result.x = -self.x
+        result.y = -self.y
+        return result
+
     def __sub__(self, other) -> Vector2D:
-        """Follows the definition of subtraction between two vectors."""
-        if isinstance(other, Vector2D):
-            x = self.x - other.x
-            y = self.y - other.y
-            return Vector2D(x, y)
-        else:
+        """Follows the definition of subtraction between two vectors. The type guard is stripped under python -O."""
+        if __debug__ and not isinstance(other, Vector2D):
             raise TypeError(f"unsupported operand type(s) for -: '{type(self).__name__}' and '{type(other).__name__}'")
+        result = Vector2D.__new__(Vector2D)
+        result.x = self.x - other.x
+        result.y = self.y - other.y
+        return result
         
     def __mul__(self, other: Vector2D) -> float:
         """Follows the definition of the dot product between two vectors."""
@@ -60,16 +75,19 @@ class Vector2D:
 
     def __rmul__(self, other: int | float) -> Vector2D:
         """Defined by the scalar multiplication of a vector."""
-        return Vector2D(float(other)*self.x, float(other)*self.y)
+        scalar = float(other)
+        result = Vector2D.__new__(Vector2D)
+        result.x = scalar*self.x
+        result.y = scalar*self.y
+        return result
     
     def __repr__(self) -> str:
         """Vector2D object's representation."""
-        filtered_attributes = {key: value for key, value in self.__dict__.items() if not key.startswith('_')}
-        return f"{self.__class__.__name__}({', '.join(f'{key}={repr(value)}' for key, value in filtered_attributes.items())})"
-    
+        return f"{self.__class__.__name__}(x={repr(self.x)}, y={repr(self.y)})"
+
     def __str__(self) -> str:
-        """Vector2D object's string representation for testing purposes."""        
-        return f"{self.__class__.__name__}({self.__dict__})"
+        """Vector2D object's string representation for testing purposes."""
+        return f"{self.__class__.__name__}({{'x': {self.x}, 'y': {self.y}}})"
 
     def pprint(self) -> str:
         """Vector2D object's pretty representation."""
@@ -81,38 +99,32 @@ class Vector2D:
     
     def rotate(self, angle: float) -> Vector2D:
         """Rotates a vector around the origin by the specified angle (in degrees)."""
-        angle = radians(float(angle))
-        return Vector2D(self.x*cos(angle) - self.y*sin(angle), self.x*sin(angle) + self.y*cos(angle))
+        cos_angle, sin_angle = _rotation_coefficients(float(angle))
+        result = Vector2D.__new__(Vector2D)
+        result.x = self.x*cos_angle - self.y*sin_angle
+        result.y = self.x*sin_angle + self.y*cos_angle
+        return result
     
     def squared_norm(self) -> float:
         """Returns the squared euclidean norm of the vector."""
-        return self.x**2.0 + self.y**2.0
+        return self.x*self.x + self.y*self.y
     
     def norm(self) -> float:
         """Returns the euclidean norm of the vector."""
-        return sqrt(self.x**2.0 + self.y**2.0)
+        return hypot(self.x, self.y)
     
     def orientation(self) -> float:
         """Returns the orientation (between 0 and 360 degrees) of the vector"""
-        # Checks if the vector is vertical.
-        if self.x == 0.0:
-            angle = 90.0 if self.y > 0.0 else 0.0 if self.y == 0.0 else -90.0
-        else:
-            angle = degrees(atan(self.y/self.x))
-
-            # Adjusts the angle if the x coordinate is negative.
-            if self.x < 0.0:
-                angle += 180.0
-
-        # Adjusts the angle to be in the specified range.
-        if angle < 0.0:
-            angle += 360.0
-
-        return angle
+        angle = degrees(atan2(self.y, self.x))
+        return angle + 360.0 if angle < 0.0 else angle
     
     def unit_vector(self) -> Vector2D:
         """Returns the unit vector of this Vector2D object."""
-        return (1/self.norm()) * self
+        norm = hypot(self.x, self.y)
+        result = Vector2D.__new__(Vector2D)
+        result.x = self.x/norm
+        result.y = self.y/norm
+        return result
 
     def projection(self, other: Vector2D) -> Vector2D:
         """Returns the projection of this Vector2D object on another vector."""
@@ -126,4 +138,22 @@ class Vector2D:
         if isinstance(other, Vector2D):
             return self - 2.0 * self.projection(other)
         else:
-            raise TypeError(f"unsupported parameter type(s) for other: '{type(other).__name__}'") 
\ No newline at end of file
+            raise TypeError(f"unsupported parameter type(s) for other: '{type(other).__name__}'")
+
+    def reflect_x(self) -> Vector2D:
+        """Returns this vector with its x coordinate flipped. Equivalent to reflection(Vector2D(1.0, 0.0))."""
+        result = Vector2D.__new__(Vector2D)
+        result.x = -self.x
+        result.y = self.y
+        return result
+
+    def reflect_y(self) -> Vector2D:
+        """Returns this vector with its y coordinate flipped. Equivalent to reflection(Vector2D(0.0, 1.0))."""
+        result = Vector2D.__new__(Vector2D)
+        result.x = self.x
+        result.y = -self.y
+        return result
+
+# Shared zero vector. Vector2D objects are immutable by convention (every operation returns a new instance),
+# so reusing this single instance is safe.
+ZERO_VECTOR = Vector2D(0.0, 0.0)
\ No newline at end of file
@@ -15,6 +15,10 @@ import json
 import numpy as np
 import os
 
+from numpy.typing import NDArray
+
+SUCCESS_HISTORY_INITIAL_CAPACITY = 256
+
 class Pong(Simulation):
     """Creates a simulation of the environnement of the arcade game Pong."""
     ball: Ball
@@ -27,7 +31,8 @@ class Pong(Simulation):
     ball_max_orientation: float
     _ball_reference_speed: float
     _agent_initial_position: Vector2D
-    _success_history_: list[tuple[bool, int]]
+    _success_history_: NDArray[np.float64]
+    _success_count_: int
 
     def __init__(
                     self, 
@@ -86,30 +91,31 @@ class Pong(Simulation):
         self.ball_max_orientation = ball_max_orientation
         self._ball_reference_speed = self.ball.speed.norm()
         self._agent_initial_position = self.agent.get_position()
-        self._success_history_ = []
+        self._success_history_ = np.empty((SUCCESS_HISTORY_INITIAL_CAPACITY, 2))
+        self._success_count_ = 0
 
     def step(self) -> None:
         super().step()
         self.check_ball_collisions()
-        self.network.propagate_signal(self._generator_, self.ball_sensory_signal_translator.generate_sensory_signal())
-        self.network.optimize_connections()
-        self.network.compute_free_energy()
+        self.network.process_tick(self._generator_, self.ball_sensory_signal_translator.generate_sensory_signal())
         
     def check_ball_collisions(self) -> None:
         """Check for ball collisions and resolves its effects, either locally or by calling another method."""
+        ball_center = self.ball.shape.center
+        ball_radius = self.ball.shape.radius
         # Detects collisions with top and bottom walls.
-        if (self.ball.shape.center.y <= self.ball.shape.radius) or (self.height - self.ball.shape.center.y <= self.ball.shape.radius):
-            reflected_speed = self.ball.speed.reflection(Vector2D(0.0, 1.0))
+        if (ball_center.y <= ball_radius) or (self.height - ball_center.y <= ball_radius):
+            reflected_speed = self.ball.speed.reflect_y()
             self.ball.set_state(speed=reflected_speed)
         # Detects collisions with left wall.
-        elif self.ball.shape.center.x <= self.ball.shape.radius:
+        elif ball_center.x <= ball_radius:
             self.network.punish(self._generator_)
-            self._success_history_.append(np.array([[0.0, self._timer_],]))
+            self._record_success(0.0)
             self.reset_agent_position()
             self.regenerate_ball()
             self.ball_sensory_signal_translator.reset_timer()
         # Detects collisions with right wall.
-        elif self.width - self.ball.shape.center.x <= self.ball.shape.radius:
+        elif self.width - ball_center.x <= ball_radius:
             self.reset_agent_position()
             self.regenerate_ball()
             self.ball_sensory_signal_translator.reset_timer()
@@ -142,7 +148,7 @@ class Pong(Simulation):
         if collided_edge_normal_vector == Vector2D(1.0, 0.0):
             # Rewards the network and record the agent's success           
             self.network.reward(self._generator_)
-            self._success_history_.append(np.array([[1.0, self._timer_],]))
+            self._record_success(1.0)
 
             # Randomizes the orientation of the ball to force the agent to move again.
             ball_speed_orientation = self._generator_.uniform(low=180.0 - self.ball_max_orientation, high=180.0 - self.ball_min_orientation)
@@ -171,13 +177,23 @@ class Pong(Simulation):
 
         self.ball.set_state(speed=ball_speed)
 
-    def get_success_history(self):
-        return np.concatenate(self._success_history_, axis=0)
-    
+    def _record_success(self, success: float) -> None:
+        """Records a rally's outcome and its time stamp in the success history buffer, growing the buffer when full."""
+        if self._success_count_ >= self._success_history_.shape[0]:
+            grown_success_history = np.empty((2*self._success_history_.shape[0], 2))
+            grown_success_history[:self._success_history_.shape[0]] = self._success_history_
+            self._success_history_ = grown_success_history
+        self._success_history_[self._success_count_, 0] = success
+        self._success_history_[self._success_count_, 1] = self._timer_
+        self._success_count_ += 1
+
+    def get_success_history(self) -> NDArray:
+        return self._success_history_[:self._success_count_]
+
     def save_success_history(self, success_history_file_name = "success_history"):
         success_history_file_path = os.path.join(self._simulation_dir_, f"{success_history_file_name}.json")
         with open(success_history_file_path, "w") as success_history_file:
-            json.dump(repr(self._success_history_), success_history_file)
+            json.dump(self.get_success_history().tolist(), success_history_file)
 
 
 class PongSignalTranslator:
@@ -188,6 +204,9 @@ class PongSignalTranslator:
     _nb_topographic_regions: int
     _neurons_by_regions: int
     _topographic_region_length: float
+    _active_signal_: list[float]
+    _inactive_signal_: list[float]
+    _frequency_slope_: float
     _timer_: int
     _simulation: Pong
 
@@ -210,6 +229,8 @@ class PongSignalTranslator:
         self.max_frequency = int(max_frequency)
         self._nb_topographic_regions = len(regions_name)
         self._neurons_by_regions = region_size // self._nb_topographic_regions
+        self._active_signal_ = [1.0] * self.region_size
+        self._inactive_signal_ = [0.0] * self.region_size
         self._timer_ = -1
         self._simulation = None
 
@@ -219,6 +240,7 @@ class PongSignalTranslator:
             raise TypeError(f"unsupported parameter type(s) for simulation: '{type(simulation).__name__}'")
         self._simulation = simulation
         self._topographic_region_length = simulation.height/self._nb_topographic_regions
+        self._frequency_slope_ = (self.min_frequency - self.max_frequency)/float(simulation.width)
 
         return self
     
@@ -231,12 +253,13 @@ class PongSignalTranslator:
         if self._simulation is None:
             raise AttributeError("simulation attribute must be initialize before using this function")
         
-        signal_frequency = self.max_frequency + (self._simulation.ball.shape.center.x/float(self._simulation.width))*(self.min_frequency - self.max_frequency)
+        ball_center = self._simulation.ball.shape.center
+        signal_frequency = self.max_frequency + ball_center.x*self._frequency_slope_
         signal_period = self._simulation.frequency/signal_frequency
 
         if self._timer_ == -1 or self._timer_ >= signal_period:
-            triggered_region_index = min(self._simulation.ball.shape.center.y // self._topographic_region_length, self._nb_topographic_regions - 1)
-            sensory_signal = {region_name: [1.0] * self.region_size if region_index == triggered_region_index else [0.0] * self.region_size for region_index, region_name in enumerate(self.regions_name)}
+            triggered_region_index = min(ball_center.y // self._topographic_region_length, self._nb_topographic_regions - 1)
+            sensory_signal = {region_name: self._active_signal_ if region_index == triggered_region_index else self._inactive_signal_ for region_index, region_name in enumerate(self.regions_name)}
             self._timer_ = 0
         else:
             sensory_signal = None
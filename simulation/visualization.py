@@ -16,12 +16,13 @@ import numpy as np
 import os
 from PIL import Image, ImageDraw
 
-def create_frame(width: int, height: int, shapes: list[Shape], positions: list[Vector2D]) -> Image.Image:
-    """Creates a Pillow Image object from a list of shapes and their positions."""
+def create_frame(width: int, height: int, shapes: list[Shape], positions: "np.ndarray") -> Image.Image:
+    """Creates a Pillow Image object from a list of shapes and their positions, given as an array of shape (elements, 2)."""
     img = Image.new("RGB", (width, height), "#000000")
     draw = ImageDraw.Draw(img)
-    
-    for shape, pos in zip(shapes, positions):            
+
+    for shape, pos in zip(shapes, positions):
+        pos = Vector2D(pos[0], pos[1])
         if isinstance(shape, Circle):
             draw.ellipse((pos.x - shape.radius, pos.y - shape.radius, pos.x + shape.radius, pos.y + shape.radius), outline=shape.outline, width=2, fill=shape.fill)
 
@@ -41,8 +42,9 @@ def generate_gif(simulation: Simulation, frame_duration: int, gif_name: str = "e
     env_width = simulation.width
     env_height = simulation.height
 
-    shapes = env_history[0] 
-    frames = env_history[1:]
+    shapes = simulation.get_env_shapes()
+    # Every row of the history is a frame of element centers, starting with the initial state.
+    frames = env_history
 
     gif_path = os.path.join(simulation.get_simulation_dir(), f"{gif_name}.gif")
 
@@ -1,4 +1,6 @@
 import unittest
+import numpy as np
+from numpy.testing import assert_equal
 
 from simulation.base_simulation import Simulation, load_simulation, load_env_history
 from simulation.elements.base_element import Element
@@ -62,7 +64,7 @@ class TestBaseElement(unittest.TestCase):
 
     def test_simulation_env_history_file(self):
         # Test save_env_history method
-        expected_env_history_path = os.path.join("results", "test_simulation", "env_history.json")
+        expected_env_history_path = os.path.join("results", "test_simulation", "env_history.npy")
 
         for _ in range(5):
             self.simulation.step()
@@ -71,11 +73,45 @@ class TestBaseElement(unittest.TestCase):
         self.assertTrue(os.path.exists(expected_env_history_path))
 
         # Test load_env_history function
-        expected_loaded_env_history = self.simulation._env_history_
+        expected_loaded_env_history = self.simulation.get_env_history()
 
         loaded_env_history = load_env_history(expected_env_history_path)
 
-        self.assertEqual(loaded_env_history, expected_loaded_env_history)
-        
+        assert_equal(loaded_env_history, expected_loaded_env_history)
+
+    def test_simulation_env_history_streaming(self):
+        expected_env_history_path = os.path.join("results", "test_simulation", "env_history.npy")
+
+        # Shrinks the in-memory buffer so the stream has to flush several chunks during the run.
+        self.simulation._env_history_ = self.simulation._env_history_[:4].copy()
+        self.simulation.enable_env_history_streaming()
+
+        expected_env_history = [[(element.shape.center.x, element.shape.center.y) for element in self.simulation._elements]]
+        for _ in range(10):
+            self.simulation.step()
+            expected_env_history.append([(element.shape.center.x, element.shape.center.y) for element in self.simulation._elements])
+        self.simulation.save_env_history()
+
+        loaded_env_history = load_env_history(expected_env_history_path)
+
+        assert_equal(loaded_env_history, np.asarray(expected_env_history, dtype=np.float32))
+
+        # The frames still buffered in memory stay addressable after the stream is finalized, and
+        # saving again must not overwrite the streamed file.
+        self.assertGreater(len(self.simulation.get_env_history()), 0)
+        self.simulation.save_env_history()
+        assert_equal(load_env_history(expected_env_history_path), np.asarray(expected_env_history, dtype=np.float32))
+
+    def test_simulation_env_history_callback(self):
+        observed_frames = []
+        self.simulation.register_env_history_callback(lambda frame: observed_frames.append(frame.copy()))
+
+        expected_env_history = [[(element.shape.center.x, element.shape.center.y) for element in self.simulation._elements]]
+        for _ in range(5):
+            self.simulation.step()
+            expected_env_history.append([(element.shape.center.x, element.shape.center.y) for element in self.simulation._elements])
+
+        assert_equal(np.asarray(observed_frames), np.asarray(expected_env_history, dtype=np.float32))
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file